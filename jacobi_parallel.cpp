@@ -6,7 +6,9 @@
 #include <iostream>
 #include <vector>
 #include <cmath>
+#include <cstdlib>
 #include <iomanip>
+#include <string>
 #include <omp.h>
 
 using namespace std;
@@ -140,9 +142,17 @@ double computeResidual(const vector<vector<double>>& A, const vector<double>& b,
     return sqrt(residual);
 }
 
-int main() {
+int main(int argc, char* argv[]) {
     // Problem sizes to test
     vector<int> sizes = {100, 500, 1000, 2000};
+
+    // --size N restricts the sweep to a single matrix size, so an external
+    // driver can shard the sizes across several processes
+    for (int a = 1; a < argc - 1; a++) {
+        if (string(argv[a]) == "--size") {
+            sizes = {atoi(argv[a + 1])};
+        }
+    }
     vector<int> threadCounts = {1, 2, 4, 8};
     double tolerance = 1e-6;
     int maxIterations = 10000;
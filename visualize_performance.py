@@ -4,106 +4,319 @@ Jacobi Method Performance Visualization
 Parses output from jacobi_parallel and creates performance charts
 """
 
+import argparse
+import hashlib
+import json
+import mmap
 import subprocess
 import re
-import matplotlib.pyplot as plt
-import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import sys
 import os
+import io
+
+import numpy as np
+
+# matplotlib is imported lazily inside create_visualizations so the
+# svg-fast render path never pays for pyplot + font-manager startup
+
+# Precompiled patterns for the size/time line classes in the benchmark
+# output; the streaming parser tokenizes table rows with str.split, the
+# bulk parser extracts them with ROW_RE through numpy.fromregex
+SIZE_RE = re.compile(r'Matrix size:\s*(\d+)\s*x\s*\d+')
+TIME_RE = re.compile(r'Time:\s*([\d.]+)\s*ms')
+ROW_RE = re.compile(r'[ \t]*(\d+)[ \t]+([\d.]+)[ \t]+([\d.]+)[ \t]+([\d.]+)%')
+
+# Structured dtype matching ROW_RE's groups
+ROW_DTYPE = [('threads', 'i4'), ('time', 'f8'), ('speedup', 'f8'), ('efficiency', 'f8')]
+
+COMPILE_CMD = [
+    "clang++", "-Xpreprocessor", "-fopenmp",
+    "-I/opt/homebrew/opt/libomp/include",
+    "-L/opt/homebrew/opt/libomp/lib", "-lomp",
+    "-O2", "-std=c++17",
+    "jacobi_parallel.cpp", "-o", "jacobi_parallel"
+]
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'jacobi_viz')
+
+# Records the compile-flag hash of the last successful build so warm runs
+# can skip the compiler when neither source nor flags changed
+BUILD_STAMP = '.jacobi_build_stamp'
+
+# Matrix sizes swept by the benchmark; must match the defaults in
+# jacobi_parallel.cpp so the sharded driver covers the same sweep
+BENCH_SIZES = [100, 500, 1000, 2000]
+
+def benchmark_fingerprint():
+    """Fingerprint the benchmark source and compile flags for cache lookup"""
+    h = hashlib.sha256()
+    with open('jacobi_parallel.cpp', 'rb') as f:
+        h.update(f.read())
+    h.update(repr(COMPILE_CMD).encode())
+    return h.hexdigest()
+
+def load_cached_results(fingerprint):
+    """Return cached parsed results for this fingerprint, or None on a miss"""
+    cache_file = os.path.join(CACHE_DIR, f'{fingerprint}.json')
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        with open(cache_file) as f:
+            data = json.load(f)
+        # JSON stringifies the integer keys; convert them back
+        data['parallel_results'] = {
+            int(threads): {int(size): time_ms for size, time_ms in by_size.items()}
+            for threads, by_size in data['parallel_results'].items()
+        }
+    except (ValueError, KeyError, TypeError, AttributeError):
+        # Corrupt or stale-schema cache entries are just misses
+        return None
+    return data
+
+def store_cached_results(fingerprint, data):
+    """Save parsed results so warm runs can skip compile+run"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    cache_file = os.path.join(CACHE_DIR, f'{fingerprint}.json')
+    # Write via a temp file so an interrupted dump can't leave a truncated
+    # entry behind a still-valid fingerprint
+    tmp_file = cache_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_file, cache_file)
+
+def run_benchmark_sharded(jobs):
+    """Run one ./jacobi_parallel process per matrix size, largest first"""
+    def run_size(size):
+        result = subprocess.run(["./jacobi_parallel", "--size", str(size)],
+                                stdout=subprocess.PIPE, text=True, check=True)
+        return result.stdout
+
+    outputs = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        # Largest sizes first so the long shards start immediately and the
+        # workers finish at roughly the same time
+        futures = {pool.submit(run_size, size): size
+                   for size in sorted(BENCH_SIZES, reverse=True)}
+        for future in as_completed(futures):
+            size = futures[future]
+            outputs[size] = future.result()
+            print(f"  size {size}x{size} finished")
+
+    # The shards are already complete output strings, so merge them in
+    # ascending size order and hand the result to the bulk parser
+    return parse_output('\n'.join(outputs[size] for size in sorted(outputs)))
+
+def compile_flags_hash():
+    """Hash of the compile command, stored in the build stamp"""
+    return hashlib.sha1(repr(COMPILE_CMD).encode()).hexdigest()
+
+def needs_recompile():
+    """True unless the binary is newer than the source and the flags match"""
+    if not os.path.exists('jacobi_parallel'):
+        return True
+    if os.path.getmtime('jacobi_parallel') < os.path.getmtime('jacobi_parallel.cpp'):
+        return True
+    try:
+        with open(BUILD_STAMP) as f:
+            return f.read().strip() != compile_flags_hash()
+    except FileNotFoundError:
+        return True
+
+def compile_and_run_parallel(jobs=1):
+    """Compile (if needed) and run the parallel Jacobi program"""
+    if needs_recompile():
+        print("Compiling jacobi_parallel.cpp...")
+        subprocess.run(COMPILE_CMD, check=True)
+        with open(BUILD_STAMP, 'w') as f:
+            f.write(compile_flags_hash())
+    else:
+        print("jacobi_parallel is up to date; skipping compile")
+
+    if jobs > 1:
+        print(f"Running jacobi_parallel ({jobs} shards)...")
+        return run_benchmark_sharded(jobs)
 
-def compile_and_run_parallel():
-    """Compile and run the parallel Jacobi program"""
-    # Compile
-    compile_cmd = [
-        "clang++", "-Xpreprocessor", "-fopenmp",
-        "-I/opt/homebrew/opt/libomp/include",
-        "-L/opt/homebrew/opt/libomp/lib", "-lomp",
-        "-O2", "-std=c++17",
-        "jacobi_parallel.cpp", "-o", "jacobi_parallel"
-    ]
-    
-    print("Compiling jacobi_parallel.cpp...")
-    subprocess.run(compile_cmd, check=True)
-    
     print("Running jacobi_parallel...")
-    result = subprocess.run(["./jacobi_parallel"], capture_output=True, text=True)
-    return result.stdout
+    proc = subprocess.Popen(["./jacobi_parallel"], stdout=subprocess.PIPE,
+                            text=True, bufsize=1)
 
-def parse_output(output):
-    """Parse the program output to extract performance data"""
+    def echo_lines(stream):
+        # Echo each line for live feedback while feeding it to the parser
+        for line in stream:
+            print(line, end='')
+            yield line
+
+    data = parse_lines(echo_lines(proc.stdout))
+    proc.stdout.close()
+    returncode = proc.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, "./jacobi_parallel")
+    return data
+
+def parse_lines(lines):
+    """Parse benchmark output lines (any iterable) into a performance data dict"""
     data = {
         'sizes': [],
         'sequential_times': [],
         'parallel_results': {}  # {threads: {size: time}}
     }
-    
+
+    sizes_seen = set()  # O(1) membership alongside the ordered list
     current_size = None
-    seq_time = None
-    
-    lines = output.split('\n')
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        
+    seq_window = 0  # lines left to look for a sequential time
+
+    for line in lines:
         # Match matrix size
-        size_match = re.search(r'Matrix size:\s*(\d+)\s*x\s*\d+', line)
+        size_match = SIZE_RE.search(line)
         if size_match:
             current_size = int(size_match.group(1))
-            if current_size not in data['sizes']:
+            if current_size not in sizes_seen:
+                sizes_seen.add(current_size)
                 data['sizes'].append(current_size)
-        
-        # Match sequential time
+            continue
+
+        # Match sequential time (within a few lines of the 'Sequential:' header)
         if 'Sequential:' in line:
-            # Look for time in next few lines
-            for j in range(i, min(i+5, len(lines))):
-                time_match = re.search(r'Time:\s*([\d.]+)\s*ms', lines[j])
-                if time_match:
-                    seq_time = float(time_match.group(1))
-                    data['sequential_times'].append(seq_time)
-                    break
-        
-        # Match parallel results table
-        thread_match = re.match(r'\s*(\d+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)%', line)
-        if thread_match and current_size is not None:
-            threads = int(thread_match.group(1))
-            time_ms = float(thread_match.group(2))
-            
+            seq_window = 5
+        elif seq_window > 0:
+            time_match = TIME_RE.search(line)
+            if time_match:
+                data['sequential_times'].append(float(time_match.group(1)))
+                seq_window = 0
+            else:
+                seq_window -= 1
+
+        # Match parallel results table: four whitespace-separated numeric
+        # fields ending in a percentage. A split+isdigit check is several
+        # times cheaper than regex on this hottest line class.
+        parts = line.split()
+        if (len(parts) == 4 and current_size is not None
+                and parts[0].isdigit() and parts[3].endswith('%')):
+            try:
+                threads = int(parts[0])
+                time_ms = float(parts[1])
+            except ValueError:
+                continue
+
             if threads not in data['parallel_results']:
                 data['parallel_results'][threads] = {}
             data['parallel_results'][threads][current_size] = time_ms
-        
-        i += 1
-    
+
     return data
 
-def create_visualizations(data):
-    """Create performance visualization charts"""
+def parse_output(output):
+    """Parse the full program output in bulk
+
+    Unlike the streaming parse_lines, this slices the output into per-size
+    sections at the 'Matrix size' headers and extracts each section's result
+    table in one numpy.fromregex call, keeping the hot row-parsing loop in C
+    rather than Python bytecode.
+    """
+    data = {
+        'sizes': [],
+        'sequential_times': [],
+        'parallel_results': {}  # {threads: {size: time}}
+    }
+
+    headers = [(m.start(), int(m.group(1))) for m in SIZE_RE.finditer(output)]
+    bounds = [offset for offset, _ in headers] + [len(output)]
+    sizes_seen = set()
+
+    for i, (offset, size) in enumerate(headers):
+        section = output[offset:bounds[i + 1]]
+        if size not in sizes_seen:
+            sizes_seen.add(size)
+            data['sizes'].append(size)
+
+        # Sequential time: first 'Time:' after the 'Sequential:' header
+        seq_pos = section.find('Sequential:')
+        if seq_pos >= 0:
+            time_match = TIME_RE.search(section, seq_pos)
+            if time_match:
+                data['sequential_times'].append(float(time_match.group(1)))
+
+        # All table rows of this section in one C-speed pass
+        rows = np.fromregex(io.StringIO(section), ROW_RE, ROW_DTYPE)
+        for row in rows:
+            by_size = data['parallel_results'].setdefault(int(row['threads']), {})
+            by_size[size] = float(row['time'])
+
+    return data
+
+def parse_log_file(path):
+    """Parse a saved benchmark log without re-running the benchmark
+
+    The file is memory-mapped and consumed line by line, so only the pages
+    the parser actually touches are faulted in rather than the whole log
+    being read onto the Python heap.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return parse_lines([])
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return parse_lines(line.decode('utf-8', 'replace')
+                               for line in iter(mm.readline, b''))
+
+def build_time_matrix(data):
+    """Flatten the nested results dict into dense arrays for downstream code
+
+    Returns (sizes, seq_arr, thread_counts, par_matrix) where par_matrix is a
+    (len(sizes), len(thread_counts)) ndarray with NaN for missing entries.
+    """
     sizes = data['sizes']
-    seq_times = data['sequential_times']
-    parallel_results = data['parallel_results']
-    
-    thread_counts = sorted(parallel_results.keys())
-    
-    # Set up the figure with subplots
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    seq_arr = np.asarray(data['sequential_times'])
+    thread_counts = sorted(data['parallel_results'])
+    par_matrix = np.array([[data['parallel_results'][t].get(s, np.nan)
+                            for t in thread_counts] for s in sizes])
+    return sizes, seq_arr, thread_counts, par_matrix
+
+def create_visualizations(sizes, seq_arr, thread_counts, par_matrix, show=True):
+    """Create performance visualization charts"""
+    import matplotlib
+    # Default to the Agg backend so headless/CI runs skip GUI initialization;
+    # honor an explicit MPLBACKEND override. Must happen before pyplot import.
+    matplotlib.use(os.environ.get('MPLBACKEND', 'Agg'))
+    # Pin one font family and warm the cache with a single findfont so the
+    # legend/title lookups below don't each walk the TTF list; skipping
+    # unicode minus avoids glyph-fallback probing as well
+    matplotlib.rcParams.update({
+        'font.family': 'DejaVu Sans',
+        'font.size': 9,
+        'mathtext.default': 'regular',
+        'axes.unicode_minus': False,
+    })
+    from matplotlib import font_manager
+    font_manager.findfont('DejaVu Sans')
+    import matplotlib.pyplot as plt
+
+    # Vectorized speedup/efficiency: one broadcasted divide each
+    speedup = np.where(par_matrix > 0, seq_arr[:, None] / par_matrix, 0.0)
+    efficiency = speedup / np.asarray(thread_counts)[None, :] * 100
+
+    # Set up the figure with a static 2x2 grid; the layout is fixed, so the
+    # margins are tuned once here instead of solved by tight_layout every run
+    fig = plt.figure(figsize=(14, 10))
+    gs = fig.add_gridspec(2, 2, hspace=0.3, wspace=0.25)
+    fig.subplots_adjust(top=0.92, bottom=0.07, left=0.06, right=0.96)
     fig.suptitle('Jacobi Iterative Method - OpenMP Performance Analysis', fontsize=14, fontweight='bold')
     
     colors = plt.cm.viridis(np.linspace(0.2, 0.8, len(thread_counts)))
     
     # 1. Execution Time Comparison (Bar Chart)
-    ax1 = axes[0, 0]
+    ax1 = fig.add_subplot(gs[0, 0])
     x = np.arange(len(sizes))
     width = 0.15
     
-    # Sequential bars
-    bars = ax1.bar(x - width * (len(thread_counts)) / 2, seq_times, width, 
-                   label='Sequential', color='gray', edgecolor='black')
-    
-    # Parallel bars for each thread count
-    for idx, threads in enumerate(thread_counts):
-        times = [parallel_results[threads].get(size, 0) for size in sizes]
-        offset = width * (idx - len(thread_counts)/2 + 1)
-        ax1.bar(x + offset, times, width, label=f'{threads} Thread(s)', 
-                color=colors[idx], edgecolor='black')
+    # Sequential and parallel bars from one contiguous (sizes x series) matrix
+    all_times = np.column_stack([seq_arr, np.nan_to_num(par_matrix)])
+    offsets = (np.arange(all_times.shape[1]) - len(thread_counts) / 2) * width
+    bar_labels = ['Sequential'] + [f'{t} Thread(s)' for t in thread_counts]
+    bar_colors = ['gray'] + list(colors)
+
+    for k in range(all_times.shape[1]):
+        ax1.bar(x + offsets[k], all_times[:, k], width, label=bar_labels[k],
+                color=bar_colors[k], edgecolor='black')
     
     ax1.set_xlabel('Matrix Size')
     ax1.set_ylabel('Execution Time (ms)')
@@ -115,16 +328,10 @@ def create_visualizations(data):
     ax1.grid(True, alpha=0.3)
     
     # 2. Speedup vs Threads (Line Chart)
-    ax2 = axes[0, 1]
+    ax2 = fig.add_subplot(gs[0, 1])
     
     for idx, size in enumerate(sizes):
-        speedups = []
-        for threads in thread_counts:
-            par_time = parallel_results[threads].get(size, 1)
-            speedup = seq_times[idx] / par_time if par_time > 0 else 0
-            speedups.append(speedup)
-        
-        ax2.plot(thread_counts, speedups, 'o-', label=f'{size}x{size}', 
+        ax2.plot(thread_counts, speedup[idx, :], 'o-', label=f'{size}x{size}',
                  linewidth=2, markersize=8)
     
     # Ideal speedup line
@@ -138,17 +345,10 @@ def create_visualizations(data):
     ax2.set_xticks(thread_counts)
     
     # 3. Efficiency vs Threads (Line Chart)
-    ax3 = axes[1, 0]
+    ax3 = fig.add_subplot(gs[1, 0])
     
     for idx, size in enumerate(sizes):
-        efficiencies = []
-        for threads in thread_counts:
-            par_time = parallel_results[threads].get(size, 1)
-            speedup = seq_times[idx] / par_time if par_time > 0 else 0
-            efficiency = (speedup / threads) * 100
-            efficiencies.append(efficiency)
-        
-        ax3.plot(thread_counts, efficiencies, 'o-', label=f'{size}x{size}', 
+        ax3.plot(thread_counts, efficiency[idx, :], 'o-', label=f'{size}x{size}',
                  linewidth=2, markersize=8)
     
     # 100% efficiency line
@@ -163,19 +363,14 @@ def create_visualizations(data):
     ax3.set_ylim(0, 120)
     
     # 4. Speedup Heatmap
-    ax4 = axes[1, 1]
+    ax4 = fig.add_subplot(gs[1, 1])
     
-    speedup_matrix = []
-    for size_idx, size in enumerate(sizes):
-        row = []
-        for threads in thread_counts:
-            par_time = parallel_results[threads].get(size, 1)
-            speedup = seq_times[size_idx] / par_time if par_time > 0 else 0
-            row.append(speedup)
-        speedup_matrix.append(row)
-    
-    speedup_array = np.array(speedup_matrix)
-    im = ax4.imshow(speedup_array, cmap='YlGn', aspect='auto')
+    # float32 is plenty for the colormap (it quantizes to 8-bit anyway) and
+    # halves the bandwidth through the norm pipeline; explicit limits keep
+    # the scale stable and let Normalize precompute once
+    speedup_array = speedup.astype(np.float32, copy=False)
+    im = ax4.imshow(speedup_array, cmap='YlGn', aspect='auto',
+                    vmin=0, vmax=float(thread_counts[-1]))
     
     ax4.set_xticks(np.arange(len(thread_counts)))
     ax4.set_yticks(np.arange(len(sizes)))
@@ -185,80 +380,238 @@ def create_visualizations(data):
     ax4.set_ylabel('Matrix Size')
     ax4.set_title('Speedup Heatmap')
     
-    # Add text annotations
-    for i in range(len(sizes)):
-        for j in range(len(thread_counts)):
-            text = ax4.text(j, i, f'{speedup_array[i, j]:.2f}',
-                           ha='center', va='center', color='black', fontsize=10)
+    # Add text annotations (skipped for large sweeps where per-cell Text
+    # artists dominate draw time and the labels are unreadable anyway)
+    if speedup_array.size < 200:
+        for (i, j), value in np.ndenumerate(speedup_array):
+            ax4.text(j, i, f'{value:.2f}',
+                     ha='center', va='center', color='black', fontsize=10)
     
     cbar = plt.colorbar(im, ax=ax4)
     cbar.set_label('Speedup')
     
-    plt.tight_layout()
-    
     # Save the figure
     output_file = 'jacobi_performance.png'
     plt.savefig(output_file, dpi=150, bbox_inches='tight')
     print(f"\nChart saved to: {output_file}")
-    
-    plt.show()
 
-def print_summary_table(data):
+    if show:
+        plt.show()
+
+def render_svg_fast(sizes, seq_arr, thread_counts, par_matrix,
+                    output_file='jacobi_performance.svg'):
+    """Render the four performance charts as one hand-built SVG
+
+    The chart shapes are fixed, so the geometry is computed directly with
+    NumPy and written as rect/polyline/text tags — no pyplot import, no
+    font-manager scan, no Agg canvas. Meant for headless CI where only the
+    output file matters.
+    """
+    speedup = np.where(par_matrix > 0, seq_arr[:, None] / par_matrix, 0.0)
+    efficiency = speedup / np.asarray(thread_counts)[None, :] * 100
+
+    width, height = 1400, 1000
+    panel_w, panel_h = 560, 370
+    panels = {  # top-left corner of each plot area
+        'times': (80, 70), 'speedup': (780, 70),
+        'efficiency': (80, 580), 'heatmap': (780, 580),
+    }
+    line_colors = ['#440154', '#31688e', '#35b779', '#fde725',
+                   '#e07b39', '#c33c54', '#5f4b8b', '#2e8b57']
+
+    out = io.StringIO()
+    out.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+              f'height="{height}" font-family="sans-serif" font-size="11">\n')
+    out.write(f'<rect width="{width}" height="{height}" fill="white"/>\n')
+    out.write(f'<text x="{width/2}" y="30" text-anchor="middle" font-size="18" '
+              'font-weight="bold">Jacobi Iterative Method - OpenMP Performance '
+              'Analysis</text>\n')
+
+    def panel_frame(px, py, title):
+        out.write(f'<rect x="{px}" y="{py}" width="{panel_w}" '
+                  f'height="{panel_h}" fill="none" stroke="#999"/>\n')
+        out.write(f'<text x="{px + panel_w/2}" y="{py - 12}" '
+                  f'text-anchor="middle" font-size="14">{title}</text>\n')
+
+    def polyline(xs, ys, color, dash=False):
+        pts = ' '.join(f'{x:.1f},{y:.1f}' for x, y in zip(xs, ys))
+        extra = ' stroke-dasharray="6,4"' if dash else ''
+        out.write(f'<polyline points="{pts}" fill="none" stroke="{color}" '
+                  f'stroke-width="2"{extra}/>\n')
+
+    # 1. Execution times, grouped bars on a log scale
+    px, py = panels['times']
+    panel_frame(px, py, 'Execution Time Comparison (ms, log scale)')
+    all_times = np.column_stack([seq_arr, np.nan_to_num(par_matrix)])
+    positive = all_times[all_times > 0]
+    lo, hi = np.log10(positive.min()) - 0.2, np.log10(positive.max()) + 0.2
+    group_w = panel_w / max(len(sizes), 1)
+    bar_w = group_w / (all_times.shape[1] + 1)
+    bar_colors = ['#808080'] + line_colors[:len(thread_counts)]
+    for si in range(len(sizes)):
+        for k in range(all_times.shape[1]):
+            value = all_times[si, k]
+            if value <= 0:
+                continue
+            frac = (np.log10(value) - lo) / (hi - lo)
+            bar_h = frac * panel_h
+            bx = px + si * group_w + (k + 0.5) * bar_w
+            out.write(f'<rect x="{bx:.1f}" y="{py + panel_h - bar_h:.1f}" '
+                      f'width="{bar_w:.1f}" height="{bar_h:.1f}" '
+                      f'fill="{bar_colors[k]}" stroke="black" stroke-width="0.5"/>\n')
+        out.write(f'<text x="{px + (si + 0.5) * group_w:.1f}" '
+                  f'y="{py + panel_h + 16}" text-anchor="middle">'
+                  f'{sizes[si]}x{sizes[si]}</text>\n')
+
+    # 2./3. Speedup and efficiency line charts share their layout
+    for key, matrix, ceiling, title in (
+            ('speedup', speedup, float(max(thread_counts)),
+             'Speedup vs Number of Threads'),
+            ('efficiency', efficiency, 120.0,
+             'Parallel Efficiency vs Number of Threads (%)')):
+        qx, qy = panels[key]
+        panel_frame(qx, qy, title)
+        xs = qx + np.linspace(40, panel_w - 40, len(thread_counts))
+        top = max(float(np.nanmax(matrix)), ceiling)
+        scale_y = lambda v: qy + panel_h - (v / top) * (panel_h - 30)
+        # Ideal reference: linear speedup or 100% efficiency
+        ideal = (np.asarray(thread_counts, dtype=float) if key == 'speedup'
+                 else np.full(len(thread_counts), 100.0))
+        polyline(xs, [scale_y(v) for v in ideal], '#000000', dash=True)
+        for si in range(len(sizes)):
+            color = line_colors[si % len(line_colors)]
+            polyline(xs, [scale_y(v) for v in matrix[si, :]], color)
+            out.write(f'<text x="{qx + panel_w - 36}" '
+                      f'y="{scale_y(matrix[si, -1]):.1f}" fill="{color}">'
+                      f'{sizes[si]}x{sizes[si]}</text>\n')
+        for ti, threads in enumerate(thread_counts):
+            out.write(f'<text x="{xs[ti]:.1f}" y="{qy + panel_h + 16}" '
+                      f'text-anchor="middle">{threads}</text>\n')
+
+    # 4. Speedup heatmap with a light-yellow to dark-green ramp
+    hx, hy = panels['heatmap']
+    panel_frame(hx, hy, 'Speedup Heatmap')
+    cell_w = panel_w / len(thread_counts)
+    cell_h = panel_h / max(len(sizes), 1)
+    vmax = float(max(thread_counts))
+    low_rgb, high_rgb = np.array([255, 255, 229]), np.array([0, 90, 50])
+    for (si, ti), value in np.ndenumerate(speedup):
+        frac = min(max(value / vmax, 0.0), 1.0)
+        r, g, b = (low_rgb + frac * (high_rgb - low_rgb)).astype(int)
+        cx, cy = hx + ti * cell_w, hy + si * cell_h
+        out.write(f'<rect x="{cx:.1f}" y="{cy:.1f}" width="{cell_w:.1f}" '
+                  f'height="{cell_h:.1f}" fill="rgb({r},{g},{b})"/>\n')
+        if speedup.size < 200:
+            out.write(f'<text x="{cx + cell_w/2:.1f}" y="{cy + cell_h/2:.1f}" '
+                      f'text-anchor="middle" dominant-baseline="middle">'
+                      f'{value:.2f}</text>\n')
+    for ti, threads in enumerate(thread_counts):
+        out.write(f'<text x="{hx + (ti + 0.5) * cell_w:.1f}" '
+                  f'y="{hy + panel_h + 16}" text-anchor="middle">{threads}</text>\n')
+    for si, size in enumerate(sizes):
+        out.write(f'<text x="{hx - 8}" y="{hy + (si + 0.5) * cell_h:.1f}" '
+                  f'text-anchor="end" dominant-baseline="middle">'
+                  f'{size}x{size}</text>\n')
+
+    out.write('</svg>\n')
+    with open(output_file, 'w') as f:
+        f.write(out.getvalue())
+    print(f"\nChart saved to: {output_file}")
+
+def print_summary_table(sizes, seq_arr, thread_counts, par_matrix):
     """Print a summary table of results"""
-    sizes = data['sizes']
-    seq_times = data['sequential_times']
-    parallel_results = data['parallel_results']
-    thread_counts = sorted(parallel_results.keys())
-    
-    print("\n" + "="*80)
-    print("PERFORMANCE SUMMARY TABLE")
-    print("="*80)
-    
-    # Header
-    header = f"{'Size':<12}{'Sequential':<15}"
-    for t in thread_counts:
-        header += f"{t} Thread(s)".center(15)
-    print(header)
-    print("-"*80)
-    
+    # All speedups in one broadcasted divide; rows assembled as list joins
+    # instead of quadratic str concatenation
+    speedup = np.where(par_matrix > 0, seq_arr[:, None] / par_matrix, 0.0)
+
+    out = ["\n" + "="*80, "PERFORMANCE SUMMARY TABLE", "="*80]
+    out.append("".join([f"{'Size':<12}{'Sequential':<15}"]
+                       + [f"{t} Thread(s)".center(15) for t in thread_counts]))
+    out.append("-"*80)
+
     for idx, size in enumerate(sizes):
-        row = f"{size}x{size:<6}{seq_times[idx]:<15.2f}"
-        for threads in thread_counts:
-            par_time = parallel_results[threads].get(size, 0)
-            speedup = seq_times[idx] / par_time if par_time > 0 else 0
-            row += f"{par_time:.2f} ({speedup:.2f}x)".center(15)
-        print(row)
-    
-    print("="*80)
+        parts = [f"{size}x{size:<6}", f"{seq_arr[idx]:<15.2f}"]
+        # NaN marks a missing cell; print a dash rather than 'nan (0.00x)'
+        parts += [(f"{par_matrix[idx, ti]:.2f} ({speedup[idx, ti]:.2f}x)"
+                   if par_matrix[idx, ti] > 0 else "-").center(15)
+                  for ti in range(len(thread_counts))]
+        out.append("".join(parts))
+
+    out.append("="*80)
+    print("\n".join(out))
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Jacobi Method Performance Visualization Tool')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='ignore cached results and recompile/rerun the benchmark')
+    parser.add_argument('--no-show', action='store_true',
+                        help='only write the PNG, never open an interactive window')
+    parser.add_argument('--format', choices=['png', 'svg-fast'], default='png',
+                        help='chart output: matplotlib PNG (default) or a '
+                             'hand-built SVG that skips matplotlib entirely')
+    parser.add_argument('--from-log', metavar='PATH',
+                        help='parse a saved benchmark log instead of '
+                             'compiling and running the benchmark')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help='run the sweep as N concurrent per-size shards '
+                             '(concurrent shards compete for cores, so timings '
+                             'are only comparable on a lightly loaded machine)')
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
+
     # Change to script directory
     script_dir = os.path.dirname(os.path.abspath(__file__))
     os.chdir(script_dir)
-    
+
     print("="*60)
     print("  Jacobi Method Performance Visualization Tool")
     print("="*60)
-    
+
     try:
-        # Compile and run the parallel program
-        output = compile_and_run_parallel()
-        
-        # Parse the output
-        data = parse_output(output)
-        
+        if args.from_log:
+            # Re-render from a saved log; no compile, no benchmark run
+            if not os.path.isfile(args.from_log):
+                print(f"Error: log file not found: {args.from_log}")
+                return
+            print(f"Parsing saved log: {args.from_log}")
+            data = parse_log_file(args.from_log)
+        else:
+            # Cheap plan phase: fingerprint source+flags and check the cache
+            # before paying for the compile and benchmark sweep
+            fingerprint = benchmark_fingerprint()
+            data = None if args.no_cache else load_cached_results(fingerprint)
+
+            if data is not None:
+                print(f"Using cached benchmark results ({fingerprint[:12]}...)")
+            else:
+                # Compile and run the parallel program, parsing output as it streams
+                data = compile_and_run_parallel(jobs=args.jobs)
+                # Only cache clean sequential sweeps: concurrent shards
+                # compete for cores, so their timings must not be served
+                # to later plain invocations
+                if data['sizes'] and args.jobs == 1:
+                    store_cached_results(fingerprint, data)
+
         if not data['sizes']:
-            print("Error: Could not parse program output")
-            print("Raw output:")
-            print(output)
+            print("Error: Could not parse program output (see raw output above)")
             return
         
+        # Flatten the nested results dict into dense arrays once; everything
+        # downstream indexes the matrix instead of chasing dict lookups
+        sizes, seq_arr, thread_counts, par_matrix = build_time_matrix(data)
+
         # Print summary table
-        print_summary_table(data)
-        
-        # Create visualizations
+        print_summary_table(sizes, seq_arr, thread_counts, par_matrix)
+
+        # Create visualizations; only pop a window for interactive sessions
         print("\nGenerating visualizations...")
-        create_visualizations(data)
+        if args.format == 'svg-fast':
+            render_svg_fast(sizes, seq_arr, thread_counts, par_matrix)
+        else:
+            create_visualizations(sizes, seq_arr, thread_counts, par_matrix,
+                                  show=not args.no_show and sys.stdout.isatty())
         
     except subprocess.CalledProcessError as e:
         print(f"Error compiling/running program: {e}")